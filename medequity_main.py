@@ -1602,13 +1602,13 @@ def create_ultra_price_chart(ticker, hist):
     fig = go.Figure()
     
     # Main price line with gradient
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=hist.index,
         y=hist['Close'],
         mode='lines',
         name=f'{ticker} Price',
         line=dict(color='#3b82f6', width=3),
-        fill='tonexty',
+        fill='tozeroy',
         fillcolor='rgba(59, 130, 246, 0.1)'
     ))
     
@@ -1617,21 +1617,21 @@ def create_ultra_price_chart(ticker, hist):
     hist['MA50'] = hist['Close'].rolling(50).mean()
     hist['MA200'] = hist['Close'].rolling(200).mean()
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=hist.index, y=hist['MA20'],
         name='MA20',
         line=dict(color='#10b981', width=2, dash='dot'),
         opacity=0.8
     ))
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=hist.index, y=hist['MA50'],
         name='MA50',
         line=dict(color='#f59e0b', width=2, dash='dash'),
         opacity=0.8
     ))
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=hist.index, y=hist['MA200'],
         name='MA200',
         line=dict(color='#ef4444', width=2, dash='longdash'),
@@ -1685,7 +1685,8 @@ def create_ultra_price_chart(ticker, hist):
         )
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    # theme=None keeps the plotly_dark template above instead of Streamlit's theme
+    st.plotly_chart(fig, use_container_width=True, theme=None)
 
 def show_ultra_smart_alerts():
     """Ultra-modern smart alerts interface with improved layout"""
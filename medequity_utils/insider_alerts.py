@@ -1,11 +1,12 @@
+import streamlit as st
 import yfinance as yf
 import pandas as pd
 import numpy as np
 import requests
 import json
 from datetime import datetime, timedelta
-import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 import warnings
 warnings.filterwarnings('ignore')
@@ -70,6 +71,7 @@ class InsiderAlertSystem:
         self.alert_history = []
         self.monitoring_active = False
         self.monitoring_thread = None
+        self.monitoring_stop_event = threading.Event()
         self.monitoring_interval = 300  # 5 minutes default
         self.auto_watchlist = [
             'PFE', 'JNJ', 'MRK', 'ABBV', 'LLY', 'BMY', 'UNH', 'CVS',
@@ -607,10 +609,15 @@ class InsiderAlertSystem:
         
         print(f"🔍 Monitoring {len(symbols)} stocks for insider activity...")
         
-        for symbol in symbols:
+        # Fetch insider data for all symbols concurrently (network-bound), then
+        # dedupe and notify serially so alert_history stays consistent.
+        # Kept small because each symbol makes several yfinance calls and Yahoo
+        # throttles/blocks bursts of concurrent requests.
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            alerts_per_symbol = list(executor.map(self.check_stock_for_alerts, symbols))
+        
+        for symbol, alerts in zip(symbols, alerts_per_symbol):
             try:
-                alerts = self.check_stock_for_alerts(symbol)
-                
                 for alert in alerts:
                     # Create a more specific alert key to avoid spam
                     alert_key = f"{alert['symbol']}_{alert['type']}_{datetime.now().strftime('%Y-%m-%d')}"
@@ -685,6 +692,7 @@ class InsiderAlertSystem:
         
         self.monitoring_interval = interval_minutes * 60  # Convert to seconds
         self.monitoring_active = True
+        self.monitoring_stop_event.clear()
         
         def background_monitor():
             print(f"🚀 Starting automatic insider monitoring every {interval_minutes} minutes...")
@@ -696,15 +704,12 @@ class InsiderAlertSystem:
                     if alerts:
                         print(f"📱 Found {len(alerts)} new alerts, notifications sent!")
                     
-                    # Wait for next scan
-                    for _ in range(self.monitoring_interval):
-                        if not self.monitoring_active:
-                            break
-                        time.sleep(1)
+                    # Wait for next scan; returns early as soon as monitoring is stopped
+                    self.monitoring_stop_event.wait(self.monitoring_interval)
                         
                 except Exception as e:
                     print(f"Error in automatic monitoring: {e}")
-                    time.sleep(60)  # Wait 1 minute before retrying
+                    self.monitoring_stop_event.wait(60)  # Wait 1 minute before retrying
             
             print("⏹️ Automatic monitoring stopped")
         
@@ -719,6 +724,7 @@ class InsiderAlertSystem:
             return False
         
         self.monitoring_active = False
+        self.monitoring_stop_event.set()
         print("⏹️ Stopping automatic monitoring...")
         
         # Wait for thread to finish (up to 5 seconds)
@@ -904,4 +910,10 @@ class InsiderAlertSystem:
                 'activity_found': False,
                 'notification_results': results,
                 'message': "No recent insider activity found - sent system status update"
-            } 
\ No newline at end of file
+            } 
+
+
+@st.cache_resource
+def get_alert_system() -> InsiderAlertSystem:
+    """Single InsiderAlertSystem shared by every session and page in this process"""
+    return InsiderAlertSystem()
@@ -5,6 +5,7 @@ import yfinance as yf
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+import io
 
 # Page configuration
 st.set_page_config(
@@ -470,7 +471,7 @@ def show_screening_results():
             
             # Export results
             if st.button("📥 Export Results"):
-                csv = df.to_csv(index=False)
+                csv = st.session_state.get('latest_screen_csv') or df.to_csv(index=False)
                 st.download_button(
                     label="Download CSV",
                     data=csv,
@@ -507,6 +508,14 @@ def run_executive_buying_screen(min_value):
         st.session_state.screening_results = results
         st.success(f"✅ Found {len(results)} stocks with executive buying activity!")
 
+def store_screen_results(results):
+    """Store screen results with their CSV export precomputed once"""
+    st.session_state.latest_screen_results = results
+    # Write straight to bytes so the download doesn't need a str -> bytes re-encode
+    buffer = io.BytesIO()
+    pd.DataFrame(results).to_csv(buffer, index=False, encoding='utf-8')
+    st.session_state.latest_screen_csv = buffer.getvalue()
+
 def run_financial_screen(criteria):
     """Run financial screening with given criteria"""
     with st.spinner("📊 Running financial metrics screening..."):
@@ -524,7 +533,7 @@ def run_financial_screen(criteria):
             }
         ]
         
-        st.session_state.latest_screen_results = results
+        store_screen_results(results)
         st.success(f"✅ Financial screening complete! Found {len(results)} qualifying stocks.")
 
 def run_ai_screen(screen_type, risk_tolerance, horizon, custom_prompt=None):
@@ -544,7 +553,7 @@ def run_ai_screen(screen_type, risk_tolerance, horizon, custom_prompt=None):
             }
         ]
         
-        st.session_state.latest_screen_results = results
+        store_screen_results(results)
         st.success(f"🤖 AI screening complete! Found {len(results)} AI-recommended stocks.")
 
 def create_results_visualization(results, viz_type):
@@ -600,14 +609,16 @@ def run_multifactor_screen(factors, weights, universe):
 
 def display_insider_results(results):
     """Display insider screening results"""
-    for result in results:
-        st.markdown(f"""
+    # Build every card first and emit them in a single markdown delta
+    cards = [f"""
         <div class="screening-result">
             <h4>🏢 {result['symbol']}</h4>
             <p><strong>Insider:</strong> {result['insider']} | <strong>Value:</strong> ${result['transaction_value']:,.0f}</p>
             <p><strong>Score:</strong> {result['score']}/100 | <strong>Days Ago:</strong> {result['days_ago']}</p>
         </div>
-        """, unsafe_allow_html=True)
+        """ for result in results]
+    if cards:
+        st.markdown(''.join(cards), unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
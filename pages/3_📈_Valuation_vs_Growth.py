@@ -4,7 +4,6 @@ import numpy as np
 import yfinance as yf
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 import sys
 import os
@@ -396,14 +395,27 @@ def show_portfolio_analysis():
             </div>
             """, unsafe_allow_html=True)
 
+# yfinance info fields read by calculate_valuation_growth_metrics and helpers
+INFO_FIELDS = (
+    'forwardPE', 'trailingPE', 'priceToSalesTrailing12Months', 'enterpriseToEbitda',
+    'revenueGrowth', 'earningsGrowth', 'sector', 'marketCap'
+)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_stock_data(ticker):
+    """Fetch yfinance info and 1y history (cached for an hour across reruns)"""
+    stock = yf.Ticker(ticker)
+    info = stock.info or {}
+    # Keep only the fields we use so the cached payload stays small
+    info = {field: info[field] for field in INFO_FIELDS if field in info}
+    return info, stock.history(period="1y")
+
 def analyze_single_stock(ticker):
     """Analyze single stock valuation vs growth"""
     with st.spinner(f"Analyzing {ticker} valuation vs growth..."):
         try:
             # Get stock data
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            hist = stock.history(period="1y")
+            info, hist = load_stock_data(ticker)
             
             if not info:
                 st.error(f"No data found for {ticker}")
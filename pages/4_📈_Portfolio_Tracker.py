@@ -256,12 +256,17 @@ def calculate_portfolio_metrics():
         'healthcare_pct': healthcare_pct
     }
 
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_current_price(ticker: str) -> float:
+    """Fetch current stock price (cached for 5 minutes; failures raise and are not cached)"""
+    stock = yf.Ticker(ticker)
+    info = stock.info
+    return info.get('currentPrice') or info.get('regularMarketPrice', 0)
+
 def get_current_price(ticker: str) -> float:
     """Get current stock price"""
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        return info.get('currentPrice') or info.get('regularMarketPrice', 0)
+        return fetch_current_price(ticker)
     except:
         return 0
 
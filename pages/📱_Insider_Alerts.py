@@ -11,7 +11,7 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(parent_dir)
 
 try:
-    from medequity_utils.insider_alerts import InsiderAlertSystem
+    from medequity_utils.insider_alerts import get_alert_system
     ALERTS_AVAILABLE = True
 except ImportError as e:
     ALERTS_AVAILABLE = False
@@ -36,22 +36,6 @@ st.markdown("""
         border-left: 4px solid #3b82f6;
     }
     
-    .status-active {
-        background: linear-gradient(135deg, #10b981, #059669);
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 20px;
-        font-weight: bold;
-    }
-    
-    .status-inactive {
-        background: linear-gradient(135deg, #ef4444, #dc2626);
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 20px;
-        font-weight: bold;
-    }
-    
     .notification-setup {
         background: #f8fafc;
         padding: 1.5rem;
@@ -62,6 +46,50 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Card markup for each Scan Now alert, filled with str.format_map
+ALERT_CARD_TEMPLATE = """
+<div class="alert-card">
+<h4>🚨 {symbol}: {title}</h4>
+<p><strong>Priority:</strong> {priority}</p>
+<p><strong>Details:</strong> {description}</p>
+</div>
+"""
+
+@st.cache_data(ttl=5, show_spinner=False)
+def get_cached_monitoring_status(_alert_system):
+    """Monitoring status, cached briefly so widget reruns don't re-query it"""
+    return _alert_system.get_monitoring_status()
+
+@st.cache_data(show_spinner=False)
+def get_cached_config_status(_alert_system):
+    """Notification config status; only changes via setup, which calls clear_status_cache()"""
+    return _alert_system.config_manager.get_config_status()
+
+@st.cache_data(ttl=900, show_spinner=False)
+def scan_watchlist(symbols, _alert_system):
+    """Scan symbols for insider alerts, cached for 15 minutes per watchlist"""
+    return _alert_system.monitor_stocks(list(symbols))
+
+@st.cache_data(show_spinner=False)
+def parse_watchlist(text):
+    """Parse comma-separated watchlist text into a tuple of unique symbols, in entry order"""
+    return tuple(dict.fromkeys(symbol.strip().upper() for symbol in text.split(',') if symbol.strip()))
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_recent_activity():
+    """Recent insider activity feed, cached for 5 minutes across sessions"""
+    # Mock recent activity data
+    return [
+        {"symbol": "PFE", "insider": "CEO Albert Bourla", "action": "Purchase", "amount": "$2,500,000", "date": "2 days ago"},
+        {"symbol": "MRNA", "insider": "CFO David Meline", "action": "Purchase", "amount": "$1,800,000", "date": "1 week ago"},
+        {"symbol": "JNJ", "insider": "Multiple Insiders", "action": "Cluster Buy", "amount": "$15,200,000", "date": "3 days ago"},
+    ]
+
+def clear_status_cache():
+    """Drop cached status after an action that changes monitoring or config"""
+    get_cached_monitoring_status.clear()
+    get_cached_config_status.clear()
+
 def main():
     st.markdown("# 📱 Insider Trading Alerts & Notifications")
     st.markdown("### Get instant notifications when healthcare insiders buy or sell stocks")
@@ -80,10 +108,7 @@ def main():
     
     # Initialize alert system
     try:
-        if 'alert_system' not in st.session_state:
-            st.session_state.alert_system = InsiderAlertSystem()
-        
-        alert_system = st.session_state.alert_system
+        alert_system = get_alert_system()
         
         # Show status at top
         show_system_status(alert_system)
@@ -111,16 +136,16 @@ def show_system_status(alert_system):
     col1, col2, col3 = st.columns(3)
     
     try:
-        status = alert_system.get_monitoring_status() if hasattr(alert_system, 'get_monitoring_status') else {}
+        status = get_cached_monitoring_status(alert_system)
         
         with col1:
             if status.get('active', False):
-                st.markdown('<span class="status-active">🟢 MONITORING ACTIVE</span>', unsafe_allow_html=True)
+                st.success("🟢 MONITORING ACTIVE")
             else:
-                st.markdown('<span class="status-inactive">🔴 MONITORING STOPPED</span>', unsafe_allow_html=True)
+                st.error("🔴 MONITORING STOPPED")
         
         with col2:
-            config_status = alert_system.config_manager.get_config_status() if hasattr(alert_system, 'config_manager') else {}
+            config_status = get_cached_config_status(alert_system) if alert_system.config_manager else {}
             if config_status.get('pushover_configured', False):
                 st.success("🔔 Pushover Configured")
             else:
@@ -133,14 +158,15 @@ def show_system_status(alert_system):
     except Exception:
         st.info("🔄 Loading system status...")
 
+@st.fragment
 def show_quick_setup(alert_system):
     """Quick setup for notifications"""
     st.header("🔧 Quick Notification Setup")
     
     # Check for permanent configuration
     try:
-        if hasattr(alert_system, 'config_manager') and alert_system.config_manager:
-            config_status = alert_system.config_manager.get_config_status()
+        if alert_system.config_manager:
+            config_status = get_cached_config_status(alert_system)
             
             if config_status['pushover_configured']:
                 st.success("✅ **PUSHOVER PERMANENTLY CONFIGURED** - You're all set!")
@@ -165,6 +191,7 @@ def show_quick_setup(alert_system):
                         try:
                             success = alert_system.start_automatic_monitoring(15)  # 15 minute intervals
                             if success:
+                                clear_status_cache()
                                 st.success("✅ Monitoring started! You'll receive alerts automatically.")
                                 st.rerun()
                             else:
@@ -190,19 +217,24 @@ def show_quick_setup(alert_system):
     </div>
     """, unsafe_allow_html=True)
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        pushover_app = st.text_input("Pushover App Token:", help="Get from pushover.net after creating an app")
-    
-    with col2:
-        pushover_user = st.text_input("Pushover User Key:", help="Your personal user key from Pushover")
+    # Form so typing tokens doesn't rerun the page until submit
+    with st.form("pushover_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            pushover_app = st.text_input("Pushover App Token:", help="Get from pushover.net after creating an app")
+        
+        with col2:
+            pushover_user = st.text_input("Pushover User Key:", help="Your personal user key from Pushover")
+        
+        pushover_submitted = st.form_submit_button("🔔 Setup Push Notifications", type="primary")
     
-    if st.button("🔔 Setup Push Notifications", type="primary"):
+    if pushover_submitted:
         if pushover_app and pushover_user:
             try:
                 success = alert_system.setup_pushover_notifications(pushover_app, pushover_user)
                 if success:
+                    clear_status_cache()
                     st.success("✅ Push notifications configured permanently!")
                     st.balloons()
                     st.rerun()
@@ -217,26 +249,31 @@ def show_quick_setup(alert_system):
     with st.expander("📧 Alternative: Email Setup"):
         st.info("Set up email notifications as backup")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            sender_email = st.text_input("Your Gmail:")
-            sender_password = st.text_input("App Password:", type="password", help="Use Gmail app password, not regular password")
-        
-        with col2:
-            recipient_email = st.text_input("Alert Email:")
+        with st.form("email_form"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                sender_email = st.text_input("Your Gmail:")
+                sender_password = st.text_input("App Password:", type="password", help="Use Gmail app password, not regular password")
+            
+            with col2:
+                recipient_email = st.text_input("Alert Email:")
+            
+            email_submitted = st.form_submit_button("📧 Setup Email")
         
-        if st.button("📧 Setup Email"):
+        if email_submitted:
             if sender_email and sender_password and recipient_email:
                 try:
                     success = alert_system.setup_email_notifications(sender_email, sender_password, recipient_email)
                     if success:
+                        clear_status_cache()
                         st.success("✅ Email notifications configured!")
                     else:
                         st.error("❌ Email setup failed")
                 except Exception as e:
                     st.error(f"Error: {e}")
 
+@st.fragment
 def show_smart_alerts(alert_system):
     """Smart alert configuration"""
     st.header("🚨 Smart Alert Configuration")
@@ -287,6 +324,7 @@ def show_smart_alerts(alert_system):
         except Exception as e:
             st.error(f"Error saving settings: {e}")
 
+@st.fragment
 def show_screening(alert_system):
     """Advanced insider screening"""
     st.header("📊 Advanced Insider Screening")
@@ -298,17 +336,30 @@ def show_screening(alert_system):
     
     with col1:
         default_watchlist = "PFE,JNJ,MRK,ABBV,LLY,BMY,UNH,CVS,MRNA,BNTX,REGN,VRTX,BIIB,GILD,AMGN,MDT,ABT,SYK,ISRG,DXCM"
-        watchlist_text = st.text_area(
-            "Healthcare Stock Watchlist (comma-separated):",
-            value=default_watchlist,
-            height=100,
-            help="Add or remove stock symbols to customize your screening list"
-        )
+        # Form so edits only rerun the page on submit; both buttons submit the edited text
+        with st.form("watchlist_form"):
+            watchlist_text = st.text_area(
+                "Healthcare Stock Watchlist (comma-separated):",
+                value=default_watchlist,
+                height=100,
+                help="Add or remove stock symbols to customize your screening list"
+            )
+            
+            update_col, scan_col = st.columns(2)
+            
+            with update_col:
+                watchlist_submitted = st.form_submit_button("📋 Update Watchlist")
+            
+            with scan_col:
+                # Scans the edited list without changing the shared monitored watchlist
+                scan_submitted = st.form_submit_button("🔍 Scan Now", type="primary")
         
-        if st.button("📋 Update Watchlist"):
-            watchlist = [symbol.strip().upper() for symbol in watchlist_text.split(',')]
+        watchlist = parse_watchlist(watchlist_text)
+        
+        if watchlist_submitted:
             try:
-                alert_system.set_auto_watchlist(watchlist)
+                alert_system.set_auto_watchlist(list(watchlist))
+                clear_status_cache()
                 st.success(f"✅ Watchlist updated! Now monitoring {len(watchlist)} stocks.")
             except Exception as e:
                 st.error(f"Error updating watchlist: {e}")
@@ -316,24 +367,27 @@ def show_screening(alert_system):
     with col2:
         st.markdown("#### 🎯 Quick Actions")
         
-        if st.button("🔍 Scan Now", type="primary"):
-            watchlist = [symbol.strip().upper() for symbol in watchlist_text.split(',')]
-            
+        force_refresh = st.checkbox("Force refresh", help="Ignore scan results cached in the last 15 minutes")
+        
+        if scan_submitted:
             with st.spinner("🔍 Scanning for insider activity..."):
                 try:
-                    alerts = alert_system.monitor_stocks(watchlist[:10])  # Limit to first 10 for demo
+                    if force_refresh:
+                        scan_watchlist.clear()
+                    alerts = scan_watchlist(tuple(sorted(watchlist[:10])), alert_system)  # Limit to first 10 for demo
+                    clear_status_cache()
                     
                     if alerts:
                         st.success(f"🚨 Found {len(alerts)} insider alerts!")
                         
-                        for alert in alerts:
-                            st.markdown(f"""
-                            <div class="alert-card">
-                                <h4>🚨 {alert['symbol']}: {alert['type'].replace('_', ' ').title()}</h4>
-                                <p><strong>Priority:</strong> {alert['priority']}</p>
-                                <p><strong>Details:</strong> {alert.get('description', 'Insider activity detected')}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                        # Emit all cards as one markdown delta
+                        cards = [ALERT_CARD_TEMPLATE.format_map({
+                            'symbol': alert['symbol'],
+                            'title': alert['type'].replace('_', ' ').title(),
+                            'priority': alert['priority'],
+                            'description': alert.get('description', 'Insider activity detected')
+                        }) for alert in alerts]
+                        st.markdown(''.join(cards), unsafe_allow_html=True)
                     else:
                         st.info("✅ No new insider alerts found in current scan")
                         
@@ -359,48 +413,46 @@ def show_screening(alert_system):
     # Screening results display
     st.markdown("### 📈 Recent Insider Activity")
     
-    # Mock recent activity data
-    recent_activity = [
-        {"symbol": "PFE", "insider": "CEO Albert Bourla", "action": "Purchase", "amount": "$2,500,000", "date": "2 days ago"},
-        {"symbol": "MRNA", "insider": "CFO David Meline", "action": "Purchase", "amount": "$1,800,000", "date": "1 week ago"},
-        {"symbol": "JNJ", "insider": "Multiple Insiders", "action": "Cluster Buy", "amount": "$15,200,000", "date": "3 days ago"},
-    ]
-    
-    for activity in recent_activity:
-        col1, col2, col3, col4 = st.columns([1, 2, 1, 1])
-        
-        with col1:
-            st.write(f"**{activity['symbol']}**")
-        
-        with col2:
-            st.write(activity['insider'])
-        
-        with col3:
-            color = "🟢" if activity['action'] in ['Purchase', 'Cluster Buy'] else "🔴"
-            st.write(f"{color} {activity['action']}")
-        
-        with col4:
-            st.write(activity['amount'])
+    recent_activity = get_recent_activity()
+    
+    # One dataframe element instead of a row of columns per activity
+    activity_df = pd.DataFrame(recent_activity)
+    activity_df['action'] = (
+        activity_df['action'].map({'Purchase': '🟢', 'Cluster Buy': '🟢'}).fillna('🔴')
+        + ' ' + activity_df['action']
+    )
+    activity_df = activity_df[['symbol', 'insider', 'action', 'amount']].rename(columns={
+        'symbol': 'Symbol', 'insider': 'Insider', 'action': 'Action', 'amount': 'Amount'
+    })
+    st.dataframe(activity_df, hide_index=True, use_container_width=True)
 
+@st.fragment
 def show_monitoring(alert_system):
     """Monitoring and automation"""
     st.header("📈 Automated Monitoring")
     
     try:
-        status = alert_system.get_monitoring_status()
+        status = get_cached_monitoring_status(alert_system)
+        active = status.get('active', False)
+        interval_minutes = status.get('interval_minutes', 15)
+        watchlist_size = status.get('watchlist_size', 0)
+        total_alerts = status.get('total_alerts', 0)
+        enabled_notifications = status.get('enabled_notifications', [])
+        continuous_enabled = status.get('continuous_enabled', False)
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
             st.markdown("#### 🤖 Monitoring Status")
             
-            if status.get('active', False):
+            if active:
                 st.success("🟢 **MONITORING ACTIVE**")
-                st.write(f"**Interval:** {status.get('interval_minutes', 15)} minutes")
-                st.write(f"**Stocks:** {status.get('watchlist_size', 0)} symbols")
+                st.write(f"**Interval:** {interval_minutes} minutes")
+                st.write(f"**Stocks:** {watchlist_size} symbols")
                 
                 if st.button("⏹️ Stop Monitoring"):
                     alert_system.stop_automatic_monitoring()
+                    clear_status_cache()
                     st.rerun()
             else:
                 st.error("🔴 **MONITORING STOPPED**")
@@ -410,6 +462,7 @@ def show_monitoring(alert_system):
                 if st.button("▶️ Start Monitoring", type="primary"):
                     success = alert_system.start_automatic_monitoring(interval)
                     if success:
+                        clear_status_cache()
                         st.success(f"✅ Monitoring started! Scanning every {interval} minutes")
                         st.rerun()
                     else:
@@ -417,24 +470,25 @@ def show_monitoring(alert_system):
         
         with col2:
             st.markdown("#### 📊 Statistics")
-            st.metric("Total Alerts", status.get('total_alerts', 0))
-            st.metric("Active Methods", len(status.get('enabled_notifications', [])))
-            st.metric("Watchlist Size", status.get('watchlist_size', 0))
+            st.metric("Total Alerts", total_alerts)
+            st.metric("Active Methods", len(enabled_notifications))
+            st.metric("Watchlist Size", watchlist_size)
             
-            if status.get('enabled_notifications'):
-                st.success(f"📱 **Active:** {', '.join(status['enabled_notifications'])}")
+            if enabled_notifications:
+                st.success(f"📱 **Active:** {', '.join(enabled_notifications)}")
             else:
                 st.warning("⚠️ No notification methods enabled")
         
         with col3:
             st.markdown("#### 🔄 Continuous Mode")
             
-            if status.get('continuous_enabled', False):
+            if continuous_enabled:
                 st.success("🔄 **AUTO-START ENABLED**")
                 st.info("Monitoring starts automatically when app opens")
                 
                 if st.button("🔴 Disable Auto-Start"):
                     alert_system.disable_continuous_monitoring()
+                    clear_status_cache()
                     st.rerun()
             else:
                 st.warning("⚪ **AUTO-START DISABLED**")
@@ -442,6 +496,7 @@ def show_monitoring(alert_system):
                 if st.button("🔄 Enable Auto-Start"):
                     success = alert_system.enable_continuous_monitoring(15)
                     if success:
+                        clear_status_cache()
                         st.success("✅ Auto-start enabled!")
                         st.rerun()
     